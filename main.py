@@ -1,26 +1,39 @@
 # main.py — Complete Fixed Traffic Simulation with Images
-from PIL import Image, ImageTk
+from PIL import Image, ImageDraw, ImageFont, ImageTk
 import tkinter as tk
 from tkinter import ttk, messagebox
-import random, time, math, threading, os
+import random, time, math, os, heapq
 from collections import deque, defaultdict
 from typing import Optional, Dict, List, Tuple
-import statistics
+import numpy as np
+try:
+    from numba import njit
+except ImportError:  # optional; the NumPy physics step is used without it
+    njit = None
 
 # -------------------------
 # CONFIG
 # -------------------------
 CANVAS_W = 1000
 CANVAS_H = 700
+CX, CY = CANVAS_W/2, CANVAS_H/2  # intersection centre
 
 GREEN_TIME = 8
 YELLOW_TIME = 2
 EMERGENCY_HOLD = 6      # seconds to hold after emergency passes
 AUTO_GREEN_DIST = 150   # distance threshold to auto-green for approaching emergency
+AUTO_GREEN_DIST2 = AUTO_GREEN_DIST * AUTO_GREEN_DIST  # compared against squared distances
 PREEMPTION_DIST = 250   # distance for traffic preemption (clear path)
 
 CHECK_INTERVAL = 200    # ms for controller tick
-ANIM_INTERVAL = 16      # ms for animation (~60fps)
+ANIM_INTERVAL = 16      # ms of simulated time per fixed physics step
+SIM_DT = ANIM_INTERVAL / 1000.0
+CONTROLLER_FRAMES = max(1, round(CHECK_INTERVAL / ANIM_INTERVAL))  # physics steps per controller step
+MAX_CATCHUP = 0.25      # s of wall time simulated per frame at most; longer stalls are dropped
+HIDDEN_POLL_INTERVAL = 200  # ms between visibility checks while minimized
+QUEUE_MAX_SKIPS = 2     # controller passes a late frame may skip the queue strips before one is forced
+MAX_FPS = 60            # upper bound on animation frames per second
+MIN_FRAME_DELAY = 5     # ms always left to Tk between frames, even when behind
 
 # Speeds (pixels per frame base)
 CAR_BASE_SPEED = 2.5
@@ -33,6 +46,37 @@ STOP_DIST = 140
 VEHICLE_SPAWN_DIST = 160
 VEHICLE_DESPAWN_DIST = 350
 MIN_SPACING = 45
+PASS_DIST = 30          # distance past the centre at which a vehicle counts as through
+MAX_VEHICLES = 256      # capacity of the vehicle state arrays
+
+DIRECTIONS = ("north", "south", "west", "east")
+DIR_ID = {d: i for i, d in enumerate(DIRECTIONS)}
+# Unit heading per direction; dot(heading, centre - position) is the signed
+# distance still to travel to the centre, so one formula covers every lane
+DIR_HEADING = {"north": (0, 1), "south": (0, -1), "west": (1, 0), "east": (-1, 0)}
+
+# Vehicle types as small ints in the state arrays; names are only used at the UI edge
+VEHICLE_TYPES = ("car", "ambulance", "firetruck", "bus")
+TYPE_ID = {t: i for i, t in enumerate(VEHICLE_TYPES)}
+AMBULANCE, FIRETRUCK = TYPE_ID["ambulance"], TYPE_ID["firetruck"]
+
+# Vehicle sprites: type -> (image files in ASSET_DIR, size before rotation)
+ASSET_DIR = "assets"
+SPRITE_FILES = {
+    "ambulance": (("ambulance.png",), (40, 80)),
+    "firetruck": (("firetruck.png",), (45, 85)),
+    "car": (("car_blue.png", "car_red.png", "car_green.png", "car_yellow.png"), (35, 70)),
+}
+DIRECTION_ANGLES = {"north": 0, "south": 180, "east": 270, "west": 90}
+ROTATION_STEPS = 16     # headings in each sprite's rotation atlas
+DIRECTION_ROTATION = {d: round(a * ROTATION_STEPS / 360) % ROTATION_STEPS for d, a in DIRECTION_ANGLES.items()}
+# Exact quarter turns are lossless pixel transposes instead of resampled rotations
+QUARTER_TURNS = {0: None, 90: Image.Transpose.ROTATE_90, 180: Image.Transpose.ROTATE_180, 270: Image.Transpose.ROTATE_270}
+SIREN_COLORS = ("red", "blue")  # base light, blinking overlay
+SIREN_TAG = "siren_blink"        # canvas tag shared by every siren overlay
+VEHICLE_TAG = "vehicle"          # canvas tag shared by every vehicle item
+QUEUE_ITEM_TAG = "queueitem"     # canvas tag shared by every item of a queue strip
+SIREN_BLINK_FRAMES = 10  # animation frames per siren color
 
 # Colors / UI
 ROAD_COLOR = "#333"
@@ -40,6 +84,26 @@ CENTER_COLOR = "#222"
 BG_COLOR = "#e9eaec"
 PANEL_BG = "#f7f9fb"
 
+# Traffic light top-bulb centres and the labels baked into the background
+TL_POSITIONS = (("north", CX+120, 60), ("south", CX-120, CANVAS_H-60),
+                ("west", 70, CY-120), ("east", CANVAS_W-70, CY+120))
+DIR_LABELS = ((CX, 20, "NORTH"), (CX, CANVAS_H-20, "SOUTH"),
+              (20, CY, "WEST"), (CANVAS_W-20, CY, "EAST"))
+
+# Signal states; also the index of the matching bulb, top to bottom
+RED, YELLOW, GREEN = 0, 1, 2
+LIGHT_COLORS = ("red", "yellow", "green")
+BULB_PITCH = 32         # px between bulb centres
+
+# Traffic light bulb fills, indexed by signal state
+BRIGHT = ("#ff0000", "#ffff00", "#00ff00")
+DIM = ("#440000", "#444400", "#004400")
+
+# Event log
+LOG_MAX_LINES = 200
+LOG_FLUSH_INTERVAL = 250  # ms; log lines written in that window reach the Listbox together
+STATS_HISTORY = 200     # recent signal/emergency events kept by StatisticsManager
+
 # Queue Visualization
 QUEUE_MAX_VEHICLES = 8
 QUEUE_VEHICLE_SIZE = 20
@@ -50,6 +114,32 @@ QUEUE_COLORS = {
     "firetruck": "#e67e22",
     "bus": "#2ecc71"
 }
+QUEUE_LABELS = {"ambulance": "A", "firetruck": "F"}  # letter drawn on emergency queue slots
+# Per type code, so recolouring a slot is a plain index
+QUEUE_COLOR_LIST = [QUEUE_COLORS.get(t, "#3498db") for t in VEHICLE_TYPES]
+QUEUE_LABEL_LIST = [QUEUE_LABELS.get(t) for t in VEHICLE_TYPES]
+QUEUE_HALF = QUEUE_VEHICLE_SIZE // 2
+QUEUE_FONT = ("Arial", 8)
+QUEUE_FONT_BOLD = ("Arial", 8, "bold")
+# Tcl helper applying a flat list of (rect, text, fill, label) slot changes in one
+# call; an empty fill hides the slot, an empty label hides its letter
+QUEUE_PROC = """
+proc updatequeue {cv data} {
+    foreach {rect text fill label} $data {
+        if {$fill eq ""} {
+            $cv itemconfigure $rect -state hidden
+            $cv itemconfigure $text -state hidden
+            continue
+        }
+        $cv itemconfigure $rect -fill $fill -state normal
+        if {$label eq ""} {
+            $cv itemconfigure $text -state hidden
+        } else {
+            $cv itemconfigure $text -text $label -state normal
+        }
+    }
+}
+"""
 
 # -------------------------
 # Statistics Manager
@@ -59,36 +149,42 @@ class StatisticsManager:
         self.reset()
         
     def reset(self):
-        self.start_time = time.time()
-        self.vehicle_stats = defaultdict(lambda: {"count": 0, "passed": 0, "wait_times": []})
-        self.signal_changes = []
-        self.emergency_events = []
+        self.start_time = time.perf_counter()
+        self.vehicle_stats = defaultdict(lambda: {"count": 0, "passed": 0, "wait_sum": 0.0, "wait_n": 0})
+        # Only recent history is kept; averages come from running sums
+        self.signal_changes = deque(maxlen=STATS_HISTORY)
+        self.emergency_events = deque(maxlen=STATS_HISTORY)
+        self.response_sum = 0.0
+        self.response_n = 0
         
     def log_vehicle(self, vehicle_type, passed=False, wait_time=0):
         self.vehicle_stats[vehicle_type]["count"] += 1
         if passed:
             self.vehicle_stats[vehicle_type]["passed"] += 1
         if wait_time > 0:
-            self.vehicle_stats[vehicle_type]["wait_times"].append(wait_time)
+            self.vehicle_stats[vehicle_type]["wait_sum"] += wait_time
+            self.vehicle_stats[vehicle_type]["wait_n"] += 1
             
     def log_signal_change(self, from_state, to_state):
         self.signal_changes.append({
-            "time": time.time(),
+            "time": time.perf_counter(),
             "from": from_state,
             "to": to_state
         })
         
     def log_emergency(self, vehicle_type, direction, response_time):
         self.emergency_events.append({
-            "time": time.time(),
+            "time": time.perf_counter(),
             "type": vehicle_type,
             "direction": direction,
             "response_time": response_time
         })
+        self.response_sum += response_time
+        self.response_n += 1
         
     def get_statistics(self):
         stats = {
-            "total_time": time.time() - self.start_time,
+            "total_time": time.perf_counter() - self.start_time,
             "total_vehicles": sum(v["count"] for v in self.vehicle_stats.values()),
             "vehicle_types": dict(self.vehicle_stats),
             "avg_wait_times": {},
@@ -96,11 +192,11 @@ class StatisticsManager:
         }
         
         for vtype, data in self.vehicle_stats.items():
-            if data["wait_times"]:
-                stats["avg_wait_times"][vtype] = statistics.mean(data["wait_times"])
+            if data["wait_n"]:
+                stats["avg_wait_times"][vtype] = data["wait_sum"] / data["wait_n"]
                 
-        if self.emergency_events:
-            stats["emergency_response_avg"] = statistics.mean(e["response_time"] for e in self.emergency_events)
+        if self.response_n:
+            stats["emergency_response_avg"] = self.response_sum / self.response_n
             
         return stats
 
@@ -113,14 +209,17 @@ class TrafficController:
         self.running = False
         
         # signals
-        self.signals = {"north": "red", "south": "red", "east": "red", "west": "red"}
+        self.signals = {"north": RED, "south": RED, "east": RED, "west": RED}
+        self.signal_green = np.zeros(len(DIRECTIONS), dtype=bool)  # by DIR_ID, kept in step with signals
         
         # normal cycle
         self.cycle_state = "ns_green"
         self.state_timer = GREEN_TIME
         
-        # emergency queue and override
-        self.emergency_queue = deque()
+        # emergency heap of (priority, queued time, vehicle id, direction, type);
+        # entries whose id is no longer in queued_ids are dropped lazily
+        self.emergency_queue: List[Tuple[int, float, int, str, str]] = []
+        self.queued_ids = set()
         self.override_active = False
         self.override_direction = None
         self.override_timer = 0.0
@@ -132,14 +231,15 @@ class TrafficController:
         if not self.running:
             self.running = True
             self.set_ns_green()
-            self._tick()
 
     def stop(self):
         self.running = False
 
-    def add_emergency(self, direction: str, vehicle_type: str):
-        emergency = {"direction": direction, "type": vehicle_type, "time": time.time()}
-        self.emergency_queue.append(emergency)
+    def add_emergency(self, direction: str, vehicle_type: str, vehicle_id: int):
+        # Priority: ambulance first, then firetruck, then arrival time
+        priority = 0 if vehicle_type == "ambulance" else 1
+        heapq.heappush(self.emergency_queue, (priority, time.perf_counter(), vehicle_id, direction, vehicle_type))
+        self.queued_ids.add(vehicle_id)
         self.ui.log_event(f"Emergency queued: {vehicle_type.upper()} from {direction.upper()}")
         
         # Start response timer
@@ -148,41 +248,46 @@ class TrafficController:
         if not self.override_active:
             self.serve_next_emergency_if_any()
 
-    def get_next_emergency(self) -> Optional[Dict]:
-        if not self.emergency_queue:
-            return None
-        # Priority: ambulance first, then firetruck
-        sorted_q = sorted(self.emergency_queue, key=lambda e: (0 if e["type"]=="ambulance" else 1, e["time"]))
-        return sorted_q[0]
+    def discard_emergency(self, vehicle_id: int):
+        # Entry stays in the heap and is skipped when it reaches the head
+        self.queued_ids.discard(vehicle_id)
+
+    def get_next_emergency(self) -> Optional[Tuple[int, float, int, str, str]]:
+        queue = self.emergency_queue
+        while queue and queue[0][2] not in self.queued_ids:
+            heapq.heappop(queue)
+        return queue[0] if queue else None
 
     def serve_next_emergency_if_any(self):
-        next_em = self.get_next_emergency()
-        if next_em:
-            try:
-                self.emergency_queue.remove(next_em)
-            except ValueError:
-                pass
+        if self.get_next_emergency():
+            _, queued_at, vehicle_id, direction, vehicle_type = heapq.heappop(self.emergency_queue)
+            self.queued_ids.discard(vehicle_id)
             
             self.override_active = True
-            self.override_direction = next_em["direction"]
+            self.override_direction = direction
             self.override_timer = EMERGENCY_HOLD
             
             # Apply emergency signals
             self.apply_emergency_signals(self.override_direction)
             
             self.ui.update_signals(self.signals, override=True)
-            self.ui.set_status(f"EMERGENCY ACTIVE: {next_em['type'].upper()} from {next_em['direction'].upper()}")
-            self.ui.log_event(f"Serving emergency: {next_em['type'].upper()} from {next_em['direction'].upper()}")
+            self.ui.set_status(f"EMERGENCY ACTIVE: {vehicle_type.upper()} from {direction.upper()}")
+            self.ui.log_event(f"Serving emergency: {vehicle_type.upper()} from {direction.upper()}")
             
             # Log response time
-            response_time = time.time() - next_em["time"]
-            self.statistics.log_emergency(next_em["type"], next_em["direction"], response_time)
+            response_time = time.perf_counter() - queued_at
+            self.statistics.log_emergency(vehicle_type, direction, response_time)
+
+    def _set_signals(self, states: Dict[str,int]):
+        self.signals.update(states)
+        for d, state in states.items():
+            self.signal_green[DIR_ID[d]] = state == GREEN
 
     def apply_emergency_signals(self, direction: str):
         if direction in ("north", "south"):
-            self.signals.update({"north": "green", "south": "green", "east": "red", "west": "red"})
+            self._set_signals({"north": GREEN, "south": GREEN, "east": RED, "west": RED})
         else:
-            self.signals.update({"east": "green", "west": "green", "north": "red", "south": "red"})
+            self._set_signals({"east": GREEN, "west": GREEN, "north": RED, "south": RED})
 
     def end_override(self):
         self.override_active = False
@@ -197,65 +302,70 @@ class TrafficController:
         self.ui.log_event("Emergency override ended; returning to normal cycle")
 
     def auto_green_for_approaching(self):
-        cx, cy = CANVAS_W/2, CANVAS_H/2
+        if self.override_active:
+            return
+        vm = self.ui.vehicle_manager
         
-        for v in self.ui.vehicle_manager.vehicles:
-            if v.vehicle_type in ("ambulance", "firetruck"):
-                dist = math.sqrt((v.x - cx)**2 + (v.y - cy)**2)
-                
-                if dist < AUTO_GREEN_DIST and not self.override_active:
-                    self.override_active = True
-                    self.override_direction = v.direction
-                    self.override_timer = EMERGENCY_HOLD
-                    self.apply_emergency_signals(v.direction)
-                    self.ui.update_signals(self.signals, override=True)
-                    self.ui.set_status(f"AUTO-GREEN: {v.vehicle_type.upper()} approaching")
-                    self.ui.log_event(f"Auto-green triggered for {v.vehicle_type.upper()} from {v.direction.upper()}")
-                    return
+        # Squared distance of every slot; only live emergency vehicles in range qualify
+        d2 = (vm.xs - CX)**2 + (vm.ys - CY)**2
+        d2[~(vm.emergency & vm.active)] = np.inf
+        i = int(np.argmin(d2))
+        if d2[i] < AUTO_GREEN_DIST2:
+            v = vm.slots[i]
+            self.discard_emergency(v.id)
+            self.override_active = True
+            self.override_direction = v.direction
+            self.override_timer = EMERGENCY_HOLD
+            self.apply_emergency_signals(v.direction)
+            self.ui.update_signals(self.signals, override=True)
+            self.ui.set_status(f"AUTO-GREEN: {v.vehicle_type.upper()} approaching")
+            self.ui.log_event(f"Auto-green triggered for {v.vehicle_type.upper()} from {v.direction.upper()}")
 
     def set_ns_green(self):
         self.cycle_state = "ns_green"
         self.state_timer = GREEN_TIME
-        self.signals.update({"north": "green", "south": "green", "east": "red", "west": "red"})
+        self._set_signals({"north": GREEN, "south": GREEN, "east": RED, "west": RED})
         self.ui.update_signals(self.signals)
         self.ui.set_status("Normal: North-South GREEN")
 
     def set_ns_yellow(self):
         self.cycle_state = "ns_yellow"
         self.state_timer = YELLOW_TIME
-        self.signals.update({"north": "yellow", "south": "yellow", "east": "red", "west": "red"})
+        self._set_signals({"north": YELLOW, "south": YELLOW, "east": RED, "west": RED})
         self.ui.update_signals(self.signals)
         self.ui.set_status("North-South YELLOW")
 
     def set_ew_green(self):
         self.cycle_state = "ew_green"
         self.state_timer = GREEN_TIME
-        self.signals.update({"east": "green", "west": "green", "north": "red", "south": "red"})
+        self._set_signals({"east": GREEN, "west": GREEN, "north": RED, "south": RED})
         self.ui.update_signals(self.signals)
         self.ui.set_status("Normal: East-West GREEN")
 
     def set_ew_yellow(self):
         self.cycle_state = "ew_yellow"
         self.state_timer = YELLOW_TIME
-        self.signals.update({"east": "yellow", "west": "yellow", "north": "red", "south": "red"})
+        self._set_signals({"east": YELLOW, "west": YELLOW, "north": RED, "south": RED})
         self.ui.update_signals(self.signals)
         self.ui.set_status("East-West YELLOW")
 
-    def _tick(self):
+    def step(self, dt: float):
+        """Advance signal timers by dt seconds; driven by the UI frame loop"""
         if not self.running:
             return
 
-        # Emergency handling
-        self.auto_green_for_approaching()
+        # Emergency handling; nothing to scan for without an emergency vehicle on the road
+        if not self.override_active and self.ui.vehicle_manager.emergency_count:
+            self.auto_green_for_approaching()
 
         if self.override_active:
-            self.override_timer -= CHECK_INTERVAL / 1000.0
+            self.override_timer -= dt
             self.ui.update_timer(int(math.ceil(self.override_timer)))
             
             if self.override_timer <= 0:
                 self.end_override()
         else:
-            self.state_timer -= CHECK_INTERVAL / 1000.0
+            self.state_timer -= dt
             self.ui.update_timer(max(0, int(math.ceil(self.state_timer))))
             
             if self.state_timer <= 0:
@@ -268,7 +378,49 @@ class TrafficController:
                 elif self.cycle_state == "ew_yellow":
                     self.set_ns_green()
 
-        self.ui.root.after(CHECK_INTERVAL, self._tick)
+# -------------------------
+# Physics step
+# -------------------------
+# Both versions advance every slot by one fixed step in place: stop at a red light
+# inside the STOP_DIST window (emergency vehicles excepted), hold MIN_SPACING
+# behind the leader (slot of the vehicle ahead in the lane, -1 for none), move,
+# and mark vehicles PASS_DIST beyond the centre as through.
+def _physics_step_numpy(dists, xs, ys, vxs, vys, speeds, dir_ids, emergency, active,
+                        leaders, green, speed_multiplier, stopped, passed):
+    stop = (np.abs(dists) < STOP_DIST) & ~green[dir_ids] & ~emergency & active
+    has_leader = active & (leaders >= 0)
+    stop |= has_leader & (dists - dists[leaders] < MIN_SPACING)
+    stopped[:] = stop
+    step = np.where(active & ~stop, speeds * speed_multiplier, 0.0)
+    xs += vxs * step
+    ys += vys * step
+    dists -= step
+    passed |= active & (dists < -PASS_DIST)
+
+
+def _physics_step_loops(dists, xs, ys, vxs, vys, speeds, dir_ids, emergency, active,
+                        leaders, green, speed_multiplier, stopped, passed):
+    # Decide every stop against the old positions before anything moves
+    for i in range(dists.shape[0]):
+        stop = False
+        if active[i]:
+            if abs(dists[i]) < STOP_DIST and not green[dir_ids[i]] and not emergency[i]:
+                stop = True
+            elif leaders[i] >= 0 and dists[i] - dists[leaders[i]] < MIN_SPACING:
+                stop = True
+        stopped[i] = stop
+    for i in range(dists.shape[0]):
+        if active[i] and not stopped[i]:
+            step = speeds[i] * speed_multiplier
+            xs[i] += vxs[i] * step
+            ys[i] += vys[i] * step
+            dists[i] -= step
+            if dists[i] < -PASS_DIST:
+                passed[i] = True
+
+
+# The loop form only pays off compiled; plain Python uses the vectorized one
+physics_step = njit(cache=True)(_physics_step_loops) if njit else _physics_step_numpy
 
 # -------------------------
 # VehicleManager
@@ -277,49 +429,164 @@ class VehicleManager:
     def __init__(self, ui, canvas):
         self.ui = ui
         self.canvas = canvas
-        self.vehicles: List['Vehicle'] = []
         self.vehicle_count = 0
+        self.emergency_count = 0  # live ambulances and firetrucks
+        
+        # per-direction lanes ordered front (oldest) to back (newest)
+        self.lane_queues: Dict[str, deque] = {d: deque() for d in DIRECTIONS}
+        self.leaders = np.full(MAX_VEHICLES, -1, dtype=np.intp)  # slot of the vehicle ahead, -1 at the front
+        # Vehicles stopped inside the STOP_DIST window, and lanes where that set changed
+        self.waiting = np.zeros(MAX_VEHICLES, dtype=bool)
+        self.queue_dirty = set(DIRECTIONS)
+        self.dirty_lanes = set()  # lanes whose leader links need rebuilding
+        
+        # Vehicle state kept as parallel arrays indexed by slot
+        self.xs = np.zeros(MAX_VEHICLES)
+        self.ys = np.zeros(MAX_VEHICLES)
+        self.vxs = np.zeros(MAX_VEHICLES)
+        self.vys = np.zeros(MAX_VEHICLES)
+        self.speeds = np.zeros(MAX_VEHICLES)
+        self.dir_ids = np.zeros(MAX_VEHICLES, dtype=np.intp)
+        self.type_ids = np.zeros(MAX_VEHICLES, dtype=np.intp)
+        self.emergency = np.zeros(MAX_VEHICLES, dtype=bool)
+        self.stopped = np.zeros(MAX_VEHICLES, dtype=bool)
+        self.passed = np.zeros(MAX_VEHICLES, dtype=bool)
+        self.active = np.zeros(MAX_VEHICLES, dtype=bool)  # slot in use
+        self.dists = np.zeros(MAX_VEHICLES)  # distance left to the centre along the lane (negative once past)
+        # Positions before the latest physics step, and where each vehicle is drawn now
+        self.prev_xs = np.zeros(MAX_VEHICLES)
+        self.prev_ys = np.zeros(MAX_VEHICLES)
+        self.drawn_xs = np.zeros(MAX_VEHICLES)
+        self.drawn_ys = np.zeros(MAX_VEHICLES)
+        self.slots: List[Optional['Vehicle']] = [None] * MAX_VEHICLES
+        self.free_slots = list(range(MAX_VEHICLES - 1, -1, -1))  # pop() hands out low slots first
+        self.vehicle_pool: List['Vehicle'] = []  # despawned Vehicle objects, reused by spawn_vehicle
+        
+        self.frame_n = 0
+        self.siren_phase = 0  # 1 while the blue siren overlay is visible
+        self.tags: List[Optional[str]] = [None] * MAX_VEHICLES  # canvas tag per slot
         
         self.spawn_points = {
-            "north": (CANVAS_W/2 - 60, -VEHICLE_SPAWN_DIST),
-            "south": (CANVAS_W/2 + 60, CANVAS_H + VEHICLE_SPAWN_DIST),
-            "west": (-VEHICLE_SPAWN_DIST, CANVAS_H/2 - 40),
-            "east": (CANVAS_W + VEHICLE_SPAWN_DIST, CANVAS_H/2 + 40)
+            "north": (CX - 60, -VEHICLE_SPAWN_DIST),
+            "south": (CX + 60, CANVAS_H + VEHICLE_SPAWN_DIST),
+            "west": (-VEHICLE_SPAWN_DIST, CY - 40),
+            "east": (CANVAS_W + VEHICLE_SPAWN_DIST, CY + 40)
+        }
+        # Lane coordinate of each spawn point; positions after that are tracked incrementally
+        self.spawn_dists = {
+            d: (CX - sx) * DIR_HEADING[d][0] + (CY - sy) * DIR_HEADING[d][1]
+            for d, (sx, sy) in self.spawn_points.items()
         }
 
-        self.velocities = {"north": (0,1), "south": (0,-1), "west": (1,0), "east": (-1,0)}
-
-    def spawn_vehicle(self, direction: Optional[str]=None, vehicle_type: str="car") -> bool:
+    def spawn_vehicle(self, direction: Optional[str]=None, vehicle_type: str="car") -> Optional['Vehicle']:
         if direction is None:
             direction = random.choice(list(self.spawn_points.keys()))
         if not self.can_spawn_at(direction):
-            return False
-        v = Vehicle(self.ui, self.canvas, direction, vehicle_type, self.velocities[direction], self.spawn_points[direction])
-        self.vehicles.append(v)
+            return None
+        if not self.free_slots:
+            return None
+        slot = self.free_slots.pop()
+        
+        vx, vy = DIR_HEADING[direction]
+        self.vxs[slot], self.vys[slot] = vx, vy
+        self.dir_ids[slot] = DIR_ID[direction]
+        self.type_ids[slot] = type_code = TYPE_ID.get(vehicle_type, TYPE_ID["car"])
+        self.emergency[slot] = type_code in (AMBULANCE, FIRETRUCK)
+        self.stopped[slot] = False
+        self.passed[slot] = False
+        self.active[slot] = True
+        self.dists[slot] = self.spawn_dists[direction]
+        
+        v = self.vehicle_pool.pop() if self.vehicle_pool else Vehicle(self.ui, self.canvas, self)
+        v.reset(slot, direction, vehicle_type, self.spawn_points[direction])
+        self.speeds[slot] = v.base_speed
+        self.prev_xs[slot] = self.drawn_xs[slot] = self.xs[slot]
+        self.prev_ys[slot] = self.drawn_ys[slot] = self.ys[slot]
+        self.slots[slot] = v
+        self.tags[slot] = v.tag
+        self.lane_queues[direction].append(v)
+        self.dirty_lanes.add(direction)
         self.vehicle_count += 1
-        self.ui.total_var.set(self.vehicle_count)
+        self.emergency_count += int(self.emergency[slot])
+        self.ui.set_total(self.vehicle_count)
         
         # Update statistics
         self.ui.controller.statistics.log_vehicle(vehicle_type)
-        return True
+        return v
 
     def can_spawn_at(self, direction: str) -> bool:
+        # Only the newest vehicle in the lane can be near the spawn point
+        lane = self.lane_queues[direction]
+        if not lane:
+            return True
+        tail = lane[-1].slot
         sx, sy = self.spawn_points[direction]
-        for v in self.vehicles:
-            if v.direction == direction:
-                if abs(v.x - sx) + abs(v.y - sy) < MIN_SPACING:
-                    return False
-        return True
-
-    def update_vehicles(self, signals: Dict[str,str], speed_multiplier: float):
-        for v in self.vehicles[:]:
-            v.check_stop_signal(signals)
-            if not v.stopped:
-                v.move(speed_multiplier)
-            if v.vehicle_type in ("ambulance", "firetruck"):
-                v.update_siren()
-            if self.should_despawn(v):
-                self.remove_vehicle(v)
+        vx, vy = DIR_HEADING[direction]
+        # Lanes are straight, so the along-axis distance the tail has covered is enough
+        return (self.xs[tail] - sx) * vx + (self.ys[tail] - sy) * vy >= MIN_SPACING
+
+    def waiting_in_lane(self, direction: str, limit: int) -> Tuple[int, List[int]]:
+        """Count of one lane's vehicles waiting inside the STOP_DIST window, and the type codes of the farthest `limit`"""
+        idx = np.flatnonzero(self.waiting & (self.dir_ids == DIR_ID[direction]))
+        d2 = (self.xs[idx] - CX) ** 2 + (self.ys[idx] - CY) ** 2
+        order = np.argsort(-d2, kind="stable")[:limit]
+        return len(idx), self.type_ids[idx[order]].tolist()
+
+    def update_vehicles(self, green: np.ndarray, speed_multiplier: float, now: float):
+        active = self.active
+        self.prev_xs[:] = self.xs
+        self.prev_ys[:] = self.ys
+        
+        # Lane order only changes on spawn/despawn, so relink just those lanes
+        for direction in self.dirty_lanes:
+            idx = np.fromiter((v.slot for v in self.lane_queues[direction]), dtype=np.intp)
+            if len(idx):
+                self.leaders[idx[0]] = -1
+                self.leaders[idx[1:]] = idx[:-1]
+        self.dirty_lanes.clear()
+        
+        # Stop mask, movement and lane coordinates for every slot at once; the
+        # stop window is the same +/- STOP_DIST band in every lane's coordinate
+        physics_step(self.dists, self.xs, self.ys, self.vxs, self.vys, self.speeds, self.dir_ids,
+                     self.emergency, active, self.leaders, green, float(speed_multiplier),
+                     self.stopped, self.passed)
+        dist = self.dists
+        
+        # Waiting vehicles are stopped, so a lane's queue only needs redrawing when
+        # a vehicle joins or leaves that set
+        waiting = self.stopped & (dist < STOP_DIST) & (dist >= -STOP_DIST)
+        changed = waiting != self.waiting
+        if changed.any():
+            self.queue_dirty.update(DIRECTIONS[d] for d in np.unique(self.dir_ids[changed]))
+            self.waiting = waiting
+        
+        # Sirens only change color every SIREN_BLINK_FRAMES frames; one tagged
+        # configure shows or hides the blue light on every emergency vehicle
+        self.frame_n += 1
+        if self.emergency_count and self.frame_n % SIREN_BLINK_FRAMES == 0:
+            self.siren_phase ^= 1
+            self.canvas.itemconfigure(SIREN_TAG, state="normal" if self.siren_phase else "hidden")
+        
+        # Vehicles never overtake, so only the front of a lane can leave the canvas
+        for lane in self.lane_queues.values():
+            while lane and self.should_despawn(lane[0]):
+                self.remove_vehicle(lane[0], now)
+
+    def render(self, alpha: float):
+        """Draw every vehicle alpha of the way through the latest physics step"""
+        rx = self.prev_xs + alpha * (self.xs - self.prev_xs)
+        ry = self.prev_ys + alpha * (self.ys - self.prev_ys)
+        dxs = rx - self.drawn_xs
+        dys = ry - self.drawn_ys
+        # Every vehicle's move (body and siren share its tag) goes to Tcl as one script;
+        # moving a tag with no items is a no-op, so the script cannot fail part-way
+        moved = np.flatnonzero(self.active & ((dxs != 0) | (dys != 0)))
+        if len(moved):
+            w, tags = str(self.canvas), self.tags
+            self.canvas.tk.eval("\n".join(f"{w} move {tags[i]} {dx!r} {dy!r}"
+                                          for i, dx, dy in zip(moved, dxs[moved].tolist(), dys[moved].tolist())))
+        self.drawn_xs[:] = rx
+        self.drawn_ys[:] = ry
 
     def should_despawn(self, v: 'Vehicle') -> bool:
         if v.direction in ("north","south"):
@@ -327,43 +594,80 @@ class VehicleManager:
         else:
             return v.x > CANVAS_W + VEHICLE_DESPAWN_DIST or v.x < -VEHICLE_DESPAWN_DIST
 
-    def remove_vehicle(self, v: 'Vehicle'):
-        if v in self.vehicles:
-            if v.vehicle_type in ("ambulance","firetruck") and v.has_passed_intersection:
-                if v.vehicle_type == "ambulance":
+    def remove_vehicle(self, v: 'Vehicle', now: Optional[float]=None):
+        if self.slots[v.slot] is v:
+            emergency = bool(self.emergency[v.slot])
+            if emergency and v.has_passed_intersection:
+                if v.type_code == AMBULANCE:
                     self.ui.amb_served_var.set(self.ui.amb_served_var.get()+1)
                 else:
                     self.ui.fire_served_var.set(self.ui.fire_served_var.get()+1)
                     
                 # Update statistics
-                wait_time = time.time() - v.spawn_time if hasattr(v, 'spawn_time') else 0
+                if now is None:
+                    now = time.perf_counter()
+                wait_time = now - v.spawn_time
                 self.ui.controller.statistics.log_vehicle(v.vehicle_type, passed=True, wait_time=wait_time)
                 
+            # A queued emergency for a vehicle that has left no longer needs serving
+            if emergency:
+                self.ui.controller.discard_emergency(v.id)
             v.destroy()
-            self.vehicles.remove(v)
+            self.active[v.slot] = False
+            self.slots[v.slot] = None
+            self.tags[v.slot] = None
+            self.free_slots.append(v.slot)
+            self.vehicle_pool.append(v)
+            lane = self.lane_queues[v.direction]
+            if lane and lane[0] is v:
+                lane.popleft()
+            else:
+                lane.remove(v)
+            self.dirty_lanes.add(v.direction)
             self.vehicle_count -= 1
-            self.ui.total_var.set(self.vehicle_count)
+            self.emergency_count -= int(emergency)
+            self.ui.set_total(self.vehicle_count)
 
     def clear_all(self):
-        for v in self.vehicles[:]:
-            v.destroy()
-        self.vehicles.clear()
+        self.canvas.delete(VEHICLE_TAG)
+        self.vehicle_pool.extend(v for v in self.slots if v is not None)
+        self.active[:] = False
+        self.slots = [None] * MAX_VEHICLES
+        self.free_slots = list(range(MAX_VEHICLES - 1, -1, -1))
+        self.tags = [None] * MAX_VEHICLES
+        for lane in self.lane_queues.values():
+            lane.clear()
+        self.dirty_lanes.update(DIRECTIONS)
+        self.waiting[:] = False
+        self.queue_dirty.update(DIRECTIONS)
         self.vehicle_count = 0
-        self.ui.total_var.set(0)
+        self.emergency_count = 0
+        self.ui.set_total(0)
 
 # -------------------------
 # Vehicle class with IMAGES
 # -------------------------
 class Vehicle:
     id_counter = 0
-    vehicle_images = {}  # Cache for vehicle images
+    # type -> one rotation atlas (image per heading step) per color variant, shared
+    # by all vehicles; emergency sprites have the red siren light baked in
+    SPRITES: Dict[str, List[List[ImageTk.PhotoImage]]] = {}
+    # x, y, stopped and has_passed_intersection are properties over the manager's arrays
+    __slots__ = ("ui", "canvas", "manager", "slot", "direction", "rotation", "vehicle_type", "type_code",
+                 "base_speed", "spawn_time", "canvas_id", "siren_id", "id", "tag")
     
-    def __init__(self, ui, canvas, direction, vehicle_type, velocity, spawn_point):
+    def __init__(self, ui, canvas, manager):
         self.ui = ui
         self.canvas = canvas
+        self.manager = manager
+
+    def reset(self, slot, direction, vehicle_type, spawn_point):
+        """Start a new trip; the manager calls this on fresh and pooled vehicles alike"""
+        self.slot = slot  # index into the manager's state arrays
         self.direction = direction
+        self.rotation = DIRECTION_ROTATION[direction]  # index into the sprite rotation atlas
         self.vehicle_type = vehicle_type
-        self.vx, self.vy = velocity
+        self.type_code = TYPE_ID.get(vehicle_type, TYPE_ID["car"])
         self.x, self.y = spawn_point
         
         # Set speed based on vehicle type
@@ -374,145 +678,122 @@ class Vehicle:
         else:
             self.base_speed = CAR_BASE_SPEED
             
-        self.speed = self.base_speed
-        self.stopped = False
-        self.has_passed_intersection = False
-        self.spawn_time = time.time()
+        self.spawn_time = time.perf_counter()
         
         self.canvas_id = None
         self.siren_id = None
-        self.blink_counter = 0
-        self.tk_image = None  # Keep reference to prevent garbage collection
         
         Vehicle.id_counter += 1
+        self.id = Vehicle.id_counter
+        self.tag = f"veh{self.id}"  # shared by every canvas item of this vehicle
         self.create_visual()
 
-    def create_visual(self):
+    @staticmethod
+    def compose_siren(img: Image.Image, color: str) -> Image.Image:
+        """Copy of a sprite with the siren light drawn 25px above its centre"""
+        w, h = img.size
+        half_h = max(h // 2, 32)  # make room for the light on sideways sprites
+        frame = Image.new("RGBA", (w, 2 * half_h), (0, 0, 0, 0))
+        frame.paste(img, (0, half_h - h // 2))
+        sx, sy = w / 2, half_h - 25
+        ImageDraw.Draw(frame).ellipse((sx - 6, sy - 6, sx + 6, sy + 6), fill=color, outline="yellow")
+        return frame
+
+    @classmethod
+    def load_sprites(cls):
+        """Load, resize and rotate every vehicle sprite once (needs a Tk root)"""
+        cls.SPRITES.clear()
+        # One directory listing instead of a stat per file
         try:
-            # Load and resize image based on vehicle type
-            if self.vehicle_type == "ambulance" and os.path.exists("assets/ambulance.png"):
-                img_path = "assets/ambulance.png"
-                size = (40, 80)
-            elif self.vehicle_type == "firetruck" and os.path.exists("assets/firetruck.png"):
-                img_path = "assets/firetruck.png"
-                size = (45, 85)
-            elif os.path.exists("assets/car_blue.png"):
-                # Randomly choose car color if available
-                car_files = ["car_blue.png", "car_red.png", "car_green.png", "car_yellow.png"]
-                available_files = [f for f in car_files if os.path.exists(f"assets/{f}")]
-                if available_files:
-                    img_path = f"assets/{random.choice(available_files)}"
-                    size = (35, 70)
-                else:
-                    raise FileNotFoundError("No car images found")
-            else:
-                raise FileNotFoundError("Image not found")
-            
-            # Load and process image
-            img = Image.open(img_path)
-            img = img.resize(size, Image.Resampling.LANCZOS)
-            
-            # Rotate based on direction
-            if self.direction == "north":
-                angle = 0
-            elif self.direction == "south":
-                angle = 180
-            elif self.direction == "east":
-                angle = 270
-            else:  # west
-                angle = 90
-                
-            img = img.rotate(angle, expand=True)
-            
-            # Convert to PhotoImage
-            self.tk_image = ImageTk.PhotoImage(img)
-            self.canvas_id = self.canvas.create_image(self.x, self.y, image=self.tk_image)
-            
-        except Exception as e:
-            # Fallback to rectangle if image loading fails
-            print(f"Failed to load image: {e}. Using fallback rectangle.")
+            available = {entry.name for entry in os.scandir(ASSET_DIR)}
+        except OSError:
+            available = set()
+        for vtype, (files, size) in SPRITE_FILES.items():
+            variants = []
+            for filename in files:
+                if filename not in available:
+                    continue
+                path = os.path.join(ASSET_DIR, filename)
+                try:
+                    img = Image.open(path).convert("RGBA").resize(size, Image.Resampling.LANCZOS)
+                except Exception as e:
+                    print(f"Failed to load image {path}: {e}")
+                    continue
+                # Rotation atlas: one entry per heading step, all from the same resized source
+                variant = []
+                for step in range(ROTATION_STEPS):
+                    angle = step * 360 / ROTATION_STEPS
+                    if angle in QUARTER_TURNS:
+                        op = QUARTER_TURNS[angle]
+                        rotated = img.transpose(op) if op is not None else img
+                    else:
+                        rotated = img.rotate(angle, Image.Resampling.BICUBIC, expand=True)
+                    if vtype in ("ambulance", "firetruck"):
+                        rotated = cls.compose_siren(rotated, SIREN_COLORS[0])
+                    variant.append(ImageTk.PhotoImage(rotated))
+                variants.append(variant)
+            if variants:
+                cls.SPRITES[vtype] = variants
+
+    def create_visual(self):
+        # Types without their own images (e.g. bus) use the car sprites
+        variants = Vehicle.SPRITES.get(self.vehicle_type) or Vehicle.SPRITES.get("car")
+        if variants:
+            image = random.choice(variants)[self.rotation]
+            self.canvas_id = self.canvas.create_image(self.x, self.y, image=image, tags=(self.tag, VEHICLE_TAG))
+        else:
+            # Fallback to rectangle if no images are available
             color = "white" if self.vehicle_type == "ambulance" else "orange" if self.vehicle_type == "firetruck" else "blue"
             w, h = (28, 16) if self.direction in ("east", "west") else (16, 28)
             self.canvas_id = self.canvas.create_rectangle(
                 self.x - w/2, self.y - h/2, 
                 self.x + w/2, self.y + h/2, 
-                fill=color, outline="black", width=1
+                fill=color, outline="black", width=1, tags=(self.tag, VEHICLE_TAG)
             )
         
-        # Siren indicator for emergency vehicles
+        # Siren indicator for emergency vehicles: the red light is part of the sprite
+        # (or its own oval for the fallback), the blue light is an overlay that the
+        # manager shows and hides for all vehicles at once through SIREN_TAG
         if self.vehicle_type in ("ambulance", "firetruck"):
             sx, sy = self.x, self.y - 25
-            self.siren_id = self.canvas.create_oval(
+            if not variants:
+                self.siren_id = self.canvas.create_oval(
+                    sx - 6, sy - 6, sx + 6, sy + 6, 
+                    fill=SIREN_COLORS[0], outline="yellow", width=1, tags=(self.tag, VEHICLE_TAG)
+                )
+            self.canvas.create_oval(
                 sx - 6, sy - 6, sx + 6, sy + 6, 
-                fill="red", outline="yellow", width=1
+                fill=SIREN_COLORS[1], outline="yellow", width=1, tags=(self.tag, VEHICLE_TAG, SIREN_TAG),
+                state="normal" if self.manager.siren_phase else "hidden"
             )
 
-    def move(self, speed_multiplier: float):
-        dx = self.vx * self.speed * speed_multiplier
-        dy = self.vy * self.speed * speed_multiplier
-        self.x += dx
-        self.y += dy
-        
-        # Move vehicle
-        if self.canvas_id:
-            self.canvas.move(self.canvas_id, dx, dy)
-        if self.siren_id:
-            self.canvas.move(self.siren_id, dx, dy)
-
-        # Mark passed intersection
-        cx, cy = CANVAS_W/2, CANVAS_H/2
-        if not self.has_passed_intersection:
-            if self.direction == "north" and self.y > cy + 30: 
-                self.has_passed_intersection = True
-            if self.direction == "south" and self.y < cy - 30: 
-                self.has_passed_intersection = True
-            if self.direction == "west" and self.x > cx + 30: 
-                self.has_passed_intersection = True
-            if self.direction == "east" and self.x < cx - 30: 
-                self.has_passed_intersection = True
-
-    def check_stop_signal(self, signals: Dict[str,str]):
-        # Emergency vehicles ignore signals
-        if self.vehicle_type in ("ambulance", "firetruck"):
-            self.stopped = False
-            return
+    # Position and movement state live in the manager's arrays
+    @property
+    def x(self) -> float:
+        return float(self.manager.xs[self.slot])
 
-        cx, cy = CANVAS_W/2, CANVAS_H/2
-        if self.direction == "north":
-            dist = cy - self.y
-            if dist < STOP_DIST and signals["north"] != "green":
-                self.stopped = True
-                return
-        elif self.direction == "south":
-            dist = self.y - cy
-            if dist < STOP_DIST and signals["south"] != "green":
-                self.stopped = True
-                return
-        elif self.direction == "west":
-            dist = cx - self.x
-            if dist < STOP_DIST and signals["west"] != "green":
-                self.stopped = True
-                return
-        elif self.direction == "east":
-            dist = self.x - cx
-            if dist < STOP_DIST and signals["east"] != "green":
-                self.stopped = True
-                return
+    @x.setter
+    def x(self, value: float):
+        self.manager.xs[self.slot] = value
 
-        self.stopped = False
+    @property
+    def y(self) -> float:
+        return float(self.manager.ys[self.slot])
 
-    def update_siren(self):
-        if not self.siren_id:
-            return
-        self.blink_counter = (self.blink_counter + 1) % 20
-        color = "red" if self.blink_counter < 10 else "blue"
-        self.canvas.itemconfig(self.siren_id, fill=color)
+    @y.setter
+    def y(self, value: float):
+        self.manager.ys[self.slot] = value
+
+    @property
+    def stopped(self) -> bool:
+        return bool(self.manager.stopped[self.slot])
+
+    @property
+    def has_passed_intersection(self) -> bool:
+        return bool(self.manager.passed[self.slot])
 
     def destroy(self):
-        if self.canvas_id:
-            self.canvas.delete(self.canvas_id)
-        if self.siren_id:
-            self.canvas.delete(self.siren_id)
+        self.canvas.delete(self.tag)
 
 # -------------------------
 # TrafficUI
@@ -532,6 +813,9 @@ class TrafficUI:
         self.panel = tk.Frame(root, width=300, height=CANVAS_H, bg=PANEL_BG)
         self.panel.place(x=CANVAS_W + 10, y=10)
 
+        # Shared vehicle images
+        Vehicle.load_sprites()
+
         # Managers
         self.vehicle_manager = VehicleManager(self, self.canvas)
         self.controller = TrafficController(self)
@@ -539,7 +823,25 @@ class TrafficUI:
         # UI variables
         self.is_running = False
         self.animation_id = None
-        self.spawn_id = None
+        self.frame_n = 0  # physics steps taken
+        self._spawn_accum = 0  # ms since the last spawn attempt
+        self._sim_accum = 0.0  # s of wall time not yet simulated
+        self._last_tick = 0.0
+        self._skip_queue_frames = 0  # frames left before late-frame queue redraws resume
+        self._queue_skips = 0  # controller passes in a row that skipped the queue strips
+        self._after = root.after
+        self.max_fps = MAX_FPS
+
+        # UI writes are recorded here and applied together by _flush_ui at the next idle
+        self._dirty = set()
+        self._pending = {}
+
+        # Event log lines not yet in the Listbox
+        self._log_buffer = deque(maxlen=LOG_MAX_LINES)
+        self._log_flush_id = None
+        self._log_lines = 0  # lines currently in the Listbox
+        self._ts_sec = -1  # second the cached timestamp string was formatted for
+        self._ts_str = ""
 
         # Stats
         self.total_var = tk.IntVar(value=0)
@@ -550,10 +852,10 @@ class TrafficUI:
 
         # Queue visualization
         self.queue_visualizations = {
-            "north": {"canvas": None, "items": [], "count": 0},
-            "south": {"canvas": None, "items": [], "count": 0},
-            "east": {"canvas": None, "items": [], "count": 0},
-            "west": {"canvas": None, "items": [], "count": 0}
+            "north": {"canvas": None, "count": 0, "signature": None},
+            "south": {"canvas": None, "count": 0, "signature": None},
+            "east": {"canvas": None, "count": 0, "signature": None},
+            "west": {"canvas": None, "count": 0, "signature": None}
         }
 
         # Controls
@@ -572,11 +874,19 @@ class TrafficUI:
 
         ttk.Label(self.panel, text="Spawn Rate (ms):", background=PANEL_BG).place(x=12,y=100)
         self.spawn_rate_var = tk.IntVar(value=1800)
-        ttk.Scale(self.panel, from_=400, to=5000, orient="horizontal", variable=self.spawn_rate_var).place(x=12,y=120,width=270)
+        self.spawn_rate_slider = ttk.Scale(self.panel, from_=400, to=5000, orient="horizontal", variable=self.spawn_rate_var)
+        self.spawn_rate_slider.place(x=12,y=120,width=270)
 
         ttk.Label(self.panel, text="Speed Multiplier:", background=PANEL_BG).place(x=12,y=150)
         self.speed_var = tk.DoubleVar(value=1.0)
-        ttk.Scale(self.panel, from_=0.4, to=2.0, orient="horizontal", variable=self.speed_var).place(x=12,y=170,width=270)
+        self.speed_slider = ttk.Scale(self.panel, from_=0.4, to=2.0, orient="horizontal", variable=self.speed_var)
+        self.speed_slider.place(x=12,y=170,width=270)
+
+        # Loops read cached Python values; refresh them whenever a slider writes its variable
+        self._spawn_rate = int(self.spawn_rate_var.get())
+        self._speed_mult = self.speed_var.get()
+        self.spawn_rate_var.trace_add("write", lambda *a: setattr(self, "_spawn_rate", int(self.spawn_rate_var.get())))
+        self.speed_var.trace_add("write", lambda *a: setattr(self, "_speed_mult", self.speed_var.get()))
 
         # Stats
         ttk.Label(self.panel, text="Statistics:", background=PANEL_BG, font=("Arial",10,"bold")).place(x=12,y=210)
@@ -632,6 +942,14 @@ class TrafficUI:
         east_queue_canvas.place(x=50, y=80)
         self.queue_visualizations["east"]["canvas"] = east_queue_canvas
         
+        try:
+            self.root.tk.eval(QUEUE_PROC)
+            self._queue_proc = True
+        except tk.TclError:
+            self._queue_proc = False
+        for queue_info in self.queue_visualizations.values():
+            self.create_queue_items(queue_info)
+        
         # Move event log down
         y_base = 525
         ttk.Label(self.panel, text="Event Log:", background=PANEL_BG, font=("Arial",10,"bold")).place(x=12,y=y_base)
@@ -642,71 +960,164 @@ class TrafficUI:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.log_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.log_list.config(yscrollcommand=scrollbar.set)
+        # Lines logged while the window is not shown (minimized, or before it first
+        # appears) are held back until it is. Child widgets stay mapped when the
+        # toplevel is iconified, so this watches the root window itself; the root's
+        # <Map> binding also sees its children's events, hence the widget check
+        self.root.bind("<Map>", lambda e: e.widget is self.root and self._flush_log(), add="+")
         ttk.Button(self.panel, text="Clear Log", command=self.clear_log).place(x=12,y=y_base+185,width=270)
 
     def draw_intersection(self):
         c = self.canvas
         road_w = 160
-        cx, cy = CANVAS_W/2, CANVAS_H/2
-        c.create_rectangle(cx-road_w/2, 0, cx+road_w/2, CANVAS_H, fill=ROAD_COLOR, outline="")
-        c.create_rectangle(0, cy-road_w/2, CANVAS_W, cy+road_w/2, fill=ROAD_COLOR, outline="")
-        c.create_rectangle(cx-road_w/2, cy-road_w/2, cx+road_w/2, cy+road_w/2, fill=CENTER_COLOR, outline="")
+        
+        # Roads are static: rasterize them once and show a single image item
+        bg = Image.new("RGB", (CANVAS_W, CANVAS_H), BG_COLOR)
+        draw = ImageDraw.Draw(bg)
+        draw.rectangle((CX-road_w/2, 0, CX+road_w/2-1, CANVAS_H-1), fill=ROAD_COLOR)
+        draw.rectangle((0, CY-road_w/2, CANVAS_W-1, CY+road_w/2-1), fill=ROAD_COLOR)
+        draw.rectangle((CX-road_w/2, CY-road_w/2, CX+road_w/2-1, CY+road_w/2-1), fill=CENTER_COLOR)
 
         # labels
-        c.create_text(CANVAS_W/2, 20, text="NORTH", fill="white", font=("Arial",12,"bold"))
-        c.create_text(CANVAS_W/2, CANVAS_H-20, text="SOUTH", fill="white", font=("Arial",12,"bold"))
-        c.create_text(20, CANVAS_H/2, text="WEST", fill="white", font=("Arial",12,"bold"))
-        c.create_text(CANVAS_W-20, CANVAS_H/2, text="EAST", fill="white", font=("Arial",12,"bold"))
+        font = self.label_font(16)
+        for x, y, text in DIR_LABELS:
+            draw.text((x, y), text, fill="white", font=font, anchor="mm")
+        self.bg_image = ImageTk.PhotoImage(bg)  # keep a reference so Tk does not drop it
+        c.create_image(0, 0, anchor="nw", image=self.bg_image)
+
+    @staticmethod
+    def label_font(size: int):
+        # Closest match to Tk's ("Arial", 12, "bold") that PIL can find on this system
+        for name in ("arialbd.ttf", "Arial Bold.ttf", "DejaVuSans-Bold.ttf"):
+            try:
+                return ImageFont.truetype(name, size)
+            except OSError:
+                continue
+        return ImageFont.load_default(size)
 
     def create_traffic_lights(self):
-        self.traffic_lights = {}
-        positions = {"north": (CANVAS_W/2+120, 60), "south": (CANVAS_W/2-120, CANVAS_H-60), 
-                    "west": (70, CANVAS_H/2-120), "east": (CANVAS_W-70, CANVAS_H/2+120)}
-        for d,(x,y) in positions.items():
-            self.traffic_lights[d] = {
-                "red": self.canvas.create_oval(x-12,y-12,x+12,y+12, fill="#440000"),
-                "yellow": self.canvas.create_oval(x-12,y+20,x+12,y+44, fill="#444400"),
-                "green": self.canvas.create_oval(x-12,y+52,x+12,y+76, fill="#004400"),
-                "glow": self.canvas.create_oval(x-24,y-24,x+24,y+24, fill="", state="hidden")
-            }
-
-    def update_signals(self, signals: Dict[str,str], override: bool=False):
-        for d,state in signals.items():
-            lights = self.traffic_lights.get(d)
-            if not lights: continue
-            self.canvas.itemconfig(lights["red"], fill="#ff0000" if state=="red" else "#440000")
-            self.canvas.itemconfig(lights["yellow"], fill="#ffff00" if state=="yellow" else "#444400")
-            self.canvas.itemconfig(lights["green"], fill="#00ff00" if state=="green" else "#004400")
-            if state=="green" and override:
-                self.canvas.itemconfig(lights["glow"], fill="#66ffcc", state="normal")
-            else:
-                self.canvas.itemconfig(lights["glow"], state="hidden")
+        # Canvas ids indexed by [DIR_ID[direction], signal state]
+        self.traffic_lights = np.zeros((len(DIRECTIONS), len(LIGHT_COLORS)), dtype=np.int32)
+        self._last_signals = {}  # direction -> (state, override) last drawn
+        self._last_update_key = None  # whole payload of the last update_signals call
+        for d,x,y in TL_POSITIONS:
+            for ci, color in enumerate(LIGHT_COLORS):
+                by = y + ci * BULB_PITCH
+                self.traffic_lights[DIR_ID[d], ci] = self.canvas.create_oval(
+                    x-12, by-12, x+12, by+12, fill=DIM[ci], tags=(f"bulb_{color}", f"{d}_{color}"))
+
+    def update_signals(self, signals: Dict[str,int], override: bool=False):
+        # Steady state between phase changes: nothing to compare per direction
+        key = (tuple(signals.items()), override)
+        if key == self._last_update_key:
+            return
+        self._last_update_key = key
+        self._pending["signals"] = key
+        self._mark_dirty("signals")
+
+    def _draw_signals(self, signals: Tuple[Tuple[str,int], ...], override: bool):
+        # Bulb tags to flip, grouped by colour so each colour is one Tcl call
+        dim: Dict[int, List[str]] = defaultdict(list)
+        lit: Dict[int, List[str]] = defaultdict(list)
+        for d,state in signals:
+            if d not in DIR_ID: continue
+            # Only touch the bulbs (and glow) whose look actually changed
+            prev, prev_override = self._last_signals.get(d, (None, False))
+            if prev == state and prev_override == override:
+                continue
+            if prev != state:
+                if prev is not None:
+                    dim[prev].append(f"{d}_{LIGHT_COLORS[prev]}")
+                lit[state].append(f"{d}_{LIGHT_COLORS[state]}")
+            # An emergency override glows as a thick outline on the green bulb itself
+            glow = state==GREEN and override
+            if glow != (prev==GREEN and prev_override):
+                green_id = int(self.traffic_lights[DIR_ID[d], GREEN])
+                if glow:
+                    self.canvas.itemconfig(green_id, outline="#66ffcc", width=4)
+                else:
+                    self.canvas.itemconfig(green_id, outline="black", width=1)
+            self._last_signals[d] = (state, override)
+        for state, tags in dim.items():
+            self.canvas.itemconfigure("||".join(tags), fill=DIM[state])
+        for state, tags in lit.items():
+            self.canvas.itemconfigure("||".join(tags), fill=BRIGHT[state])
 
     def update_timer(self, seconds: int):
-        self.timer_var.set(f"Timer: {seconds}s")
+        # Called every controller step but the whole seconds change far less often;
+        # _pending keeps the last value after a flush, so it doubles as the last shown
+        if self._pending.get("timer") == seconds:
+            return
+        self._pending["timer"] = seconds
+        self._mark_dirty("timer")
 
     def set_status(self, text: str):
-        self.status_var.set(text)
+        if self._pending.get("status") == text:
+            return
+        self._pending["status"] = text
+        self._mark_dirty("status")
+
+    def set_total(self, count: int):
+        # Spawns and despawns in the same frame end up as one label update
+        self._pending["total"] = count
+        self._mark_dirty("total")
+
+    def _mark_dirty(self, what: str):
+        # The first write since the last flush schedules it; update_idletasks at
+        # the end of an animation frame runs it, and so does Tk when stopped
+        if not self._dirty:
+            self.root.after_idle(self._flush_ui)
+        self._dirty.add(what)
+
+    def _flush_ui(self):
+        dirty, self._dirty = self._dirty, set()
+        if "signals" in dirty:
+            self._draw_signals(*self._pending["signals"])
+        if "timer" in dirty:
+            self.timer_var.set(f"Timer: {self._pending['timer']}s")
+        if "status" in dirty:
+            self.status_var.set(self._pending["status"])
+        if "total" in dirty:
+            self.total_var.set(self._pending["total"])
 
     def log_event(self, text: str):
-        ts = time.strftime("%H:%M:%S")
-        self.log_list.insert(0, f"[{ts}] {text}")
-        if self.log_list.size() > 200:
-            self.log_list.delete(200, tk.END)
+        now = int(time.time())  # wall clock: this is the timestamp shown in the log
+        if now != self._ts_sec:
+            self._ts_sec = now
+            self._ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+        self._log_buffer.append(f"[{self._ts_str}] {text}")
+        # Coalesce bursts of events into one Listbox refresh per LOG_FLUSH_INTERVAL
+        if self._log_flush_id is None:
+            self._log_flush_id = self.root.after(LOG_FLUSH_INTERVAL, self._log_timer)
+
+    def _log_timer(self):
+        self._log_flush_id = None
+        self._flush_log()
+
+    def _flush_log(self):
+        if not self._log_buffer or not self.root.winfo_viewable():
+            return
+        # Newest at the bottom: append, then trim the oldest lines off the top
+        self.log_list.insert(tk.END, *self._log_buffer)
+        self._log_lines += len(self._log_buffer)
+        self._log_buffer.clear()
+        if self._log_lines > LOG_MAX_LINES:
+            self.log_list.delete(0, self._log_lines - LOG_MAX_LINES - 1)
+            self._log_lines = LOG_MAX_LINES
+        self.log_list.yview_moveto(1.0)
 
     def clear_log(self):
+        self._log_buffer.clear()
         self.log_list.delete(0, tk.END)
+        self._log_lines = 0
         self.log_event("Log cleared")
 
-    def get_vehicle_distance_to_intersection(self, vehicle):
-        """Calculate vehicle's distance to intersection center"""
-        cx, cy = CANVAS_W/2, CANVAS_H/2
-        return math.sqrt((vehicle.x - cx)**2 + (vehicle.y - cy)**2)
-
     def update_queue_visualization(self):
-        """Update the queue visualization for all directions"""
-        for direction in ["north", "south", "east", "west"]:
+        """Update the queue visualization for the directions whose queue changed"""
+        dirty = self.vehicle_manager.queue_dirty
+        for direction in [d for d in ("north", "south", "east", "west") if d in dirty]:
             self.update_direction_queue(direction)
+        dirty.clear()
     
     def update_direction_queue(self, direction: str):
         """Update queue visualization for a specific direction"""
@@ -718,70 +1129,91 @@ class TrafficUI:
         if not canvas:
             return
         
-        # Clear existing queue items
-        for item in queue_info["items"]:
-            canvas.delete(item)
-        queue_info["items"] = []
-        
-        # Count vehicles waiting at this signal
-        waiting_vehicles = []
-        for vehicle in self.vehicle_manager.vehicles:
-            if vehicle.direction == direction and vehicle.stopped:
-                # Check if vehicle is within stopping distance
-                cx, cy = CANVAS_W/2, CANVAS_H/2
-                if direction == "north" and cy - vehicle.y < STOP_DIST:
-                    waiting_vehicles.append(vehicle)
-                elif direction == "south" and vehicle.y - cy < STOP_DIST:
-                    waiting_vehicles.append(vehicle)
-                elif direction == "west" and cx - vehicle.x < STOP_DIST:
-                    waiting_vehicles.append(vehicle)
-                elif direction == "east" and vehicle.x - cx < STOP_DIST:
-                    waiting_vehicles.append(vehicle)
-        
-        # Sort by distance to intersection (closest first)
-        waiting_vehicles.sort(key=lambda v: self.get_vehicle_distance_to_intersection(v), reverse=True)
-        
-        # Limit to max display
-        display_vehicles = waiting_vehicles[:QUEUE_MAX_VEHICLES]
-        queue_info["count"] = len(waiting_vehicles)
-        
-        # Draw queue visualization
+        # Type codes of the vehicles waiting at this signal, farthest from the centre first,
+        # read straight from the state arrays
+        waiting_count, display_types = self.vehicle_manager.waiting_in_lane(direction, QUEUE_MAX_VEHICLES)
+        queue_info["count"] = waiting_count
+        
+        # The drawing only depends on the total and the types shown; skip it if neither changed
+        signature = (waiting_count, tuple(display_types))
+        if signature == queue_info["signature"]:
+            return
+        queue_info["signature"] = signature
+        
+        # Reconfigure only the slots whose vehicle type changed
+        shown = queue_info["shown"]
+        updates = []
+        for i in range(QUEUE_MAX_VEHICLES):
+            code = display_types[i] if i < len(display_types) else None
+            if code == shown[i]:
+                continue
+            shown[i] = code
+            rect, text = queue_info["rects"][i], queue_info["texts"][i]
+            if code is None:
+                updates += (rect, text, "", "")
+            else:
+                # Vehicle type indicator goes on the text item
+                updates += (rect, text, QUEUE_COLOR_LIST[code], QUEUE_LABEL_LIST[code] or "")
+        if updates:
+            self.apply_queue_slots(canvas, updates)
+        
+        # If there are more vehicles than we can display, show a count
+        extra_count = max(0, waiting_count - QUEUE_MAX_VEHICLES)
+        if extra_count == queue_info["extra"]:
+            return
+        queue_info["extra"] = extra_count
+        if extra_count:
+            canvas.itemconfigure(queue_info["more"], text=f"+{extra_count} more", state="normal")
+        else:
+            canvas.itemconfigure(queue_info["more"], state="hidden")
+
+    def apply_queue_slots(self, canvas: tk.Canvas, updates: list):
+        """Apply flat (rect, text, fill, label) groups, in one Tcl call when updatequeue is installed"""
+        if self._queue_proc:
+            try:
+                canvas.tk.call("updatequeue", str(canvas), tuple(updates))
+                return
+            except tk.TclError:
+                self._queue_proc = False
+        for k in range(0, len(updates), 4):
+            rect, text, fill, label = updates[k:k + 4]
+            if not fill:
+                canvas.itemconfigure(rect, state="hidden")
+                canvas.itemconfigure(text, state="hidden")
+                continue
+            canvas.itemconfigure(rect, fill=fill, state="normal")
+            if label:
+                canvas.itemconfigure(text, text=label, state="normal")
+            else:
+                canvas.itemconfigure(text, state="hidden")
+
+    def create_queue_items(self, queue_info: dict):
+        """Create one direction's queue slots once; updates only show, hide and recolor them"""
+        canvas = queue_info["canvas"]
+        queue_info["rects"], queue_info["texts"] = [], []
         x_pos = 5
-        for i, vehicle in enumerate(display_vehicles):
-            color = QUEUE_COLORS.get(vehicle.vehicle_type, "#3498db")
-            
-            # Draw vehicle rectangle
-            rect = canvas.create_rectangle(
+        for _ in range(QUEUE_MAX_VEHICLES):
+            queue_info["rects"].append(canvas.create_rectangle(
                 x_pos, 5,
                 x_pos + QUEUE_VEHICLE_SIZE, 5 + QUEUE_VEHICLE_SIZE,
-                fill=color, outline="black", width=1
-            )
-            queue_info["items"].append(rect)
-            
-            # Add vehicle type indicator
-            if vehicle.vehicle_type == "ambulance":
-                indicator = canvas.create_text(
-                    x_pos + QUEUE_VEHICLE_SIZE//2, 5 + QUEUE_VEHICLE_SIZE//2,
-                    text="A", fill="white", font=("Arial", 8, "bold")
-                )
-                queue_info["items"].append(indicator)
-            elif vehicle.vehicle_type == "firetruck":
-                indicator = canvas.create_text(
-                    x_pos + QUEUE_VEHICLE_SIZE//2, 5 + QUEUE_VEHICLE_SIZE//2,
-                    text="F", fill="white", font=("Arial", 8, "bold")
-                )
-                queue_info["items"].append(indicator)
-            
+                outline="black", width=1, state="hidden", tags=QUEUE_ITEM_TAG
+            ))
+            queue_info["texts"].append(canvas.create_text(
+                x_pos + QUEUE_HALF, 5 + QUEUE_HALF,
+                fill="white", font=QUEUE_FONT_BOLD, state="hidden", tags=QUEUE_ITEM_TAG
+            ))
             x_pos += QUEUE_VEHICLE_SIZE + QUEUE_SPACING
-        
-        # If there are more vehicles than we can display, show a count
-        if len(waiting_vehicles) > QUEUE_MAX_VEHICLES:
-            extra_count = len(waiting_vehicles) - QUEUE_MAX_VEHICLES
-            count_text = canvas.create_text(
-                x_pos + 10, 5 + QUEUE_VEHICLE_SIZE//2,
-                text=f"+{extra_count} more", fill="#666", font=("Arial", 8)
-            )
-            queue_info["items"].append(count_text)
+        queue_info["more"] = canvas.create_text(
+            x_pos + 10, 5 + QUEUE_HALF,
+            fill="#666", font=QUEUE_FONT, state="hidden", tags=QUEUE_ITEM_TAG
+        )
+        queue_info["shown"] = [None] * QUEUE_MAX_VEHICLES  # vehicle type code per slot, None if hidden
+        queue_info["extra"] = 0  # count on the "+N more" label, 0 while it is hidden
+
+    def hide_queue_items(self, queue_info: dict):
+        queue_info["canvas"].itemconfigure(QUEUE_ITEM_TAG, state="hidden")
+        queue_info["shown"] = [None] * QUEUE_MAX_VEHICLES
+        queue_info["extra"] = 0
 
     # -------------------------
     # Simulation controls
@@ -790,7 +1222,10 @@ class TrafficUI:
         if not self.is_running:
             self.is_running = True
             self.controller.start()
-            self.start_spawning()
+            self._spawn_accum = self._spawn_rate  # spawn on the first frame
+            self._sim_accum = SIM_DT  # and take a physics step on it
+            self._last_tick = time.perf_counter()
+            self._skip_queue_frames = self._queue_skips = 0
             self.start_animation()
             self.set_status("Simulation running")
             self.log_event("Simulation started")
@@ -799,8 +1234,6 @@ class TrafficUI:
         if self.is_running:
             self.is_running = False
             self.controller.stop()
-            if self.spawn_id:
-                self.root.after_cancel(self.spawn_id); self.spawn_id = None
             if self.animation_id:
                 self.root.after_cancel(self.animation_id); self.animation_id = None
             self.set_status("Simulation stopped")
@@ -811,6 +1244,7 @@ class TrafficUI:
         self.vehicle_manager.clear_all()
         self.total_var.set(0); self.amb_served_var.set(0); self.fire_served_var.set(0)
         self.controller.emergency_queue.clear()
+        self.controller.queued_ids.clear()
         self.controller.override_active = False
         self.controller.override_direction = None
         self.controller.statistics.reset()
@@ -821,38 +1255,73 @@ class TrafficUI:
             queue_info = self.queue_visualizations[direction]
             canvas = queue_info["canvas"]
             if canvas:
-                for item in queue_info["items"]:
-                    canvas.delete(item)
-                queue_info["items"] = []
+                self.hide_queue_items(queue_info)
                 queue_info["count"] = 0
+                queue_info["signature"] = None
         
         self.set_status("Simulation reset")
         self.log_event("Simulation reset")
 
-    # spawning
-    def start_spawning(self):
-        if not self.is_running: return
-        spawned = self.vehicle_manager.spawn_vehicle()
-        if spawned:
-            self.total_var.set(self.vehicle_manager.vehicle_count)
-        rate = int(self.spawn_rate_var.get())
-        self.spawn_id = self.root.after(rate, self.start_spawning)
+    def step_simulation(self, now: float):
+        # Signal logic and spawning advance with the same fixed step as the vehicles
+        self.frame_n += 1
+        if self.frame_n % CONTROLLER_FRAMES == 0:
+            self.controller.step(CONTROLLER_FRAMES * SIM_DT)
+            # Queues change slowly, so they are refreshed at the controller's rate;
+            # while frames run late the dirty lanes wait, but never for more than
+            # QUEUE_MAX_SKIPS passes so the strips keep up under steady load
+            if self._skip_queue_frames and self._queue_skips < QUEUE_MAX_SKIPS:
+                self._queue_skips += 1
+            else:
+                self._queue_skips = 0
+                self.update_queue_visualization()
+        self._spawn_accum += ANIM_INTERVAL
+        if self._spawn_accum >= self._spawn_rate:
+            self._spawn_accum = 0
+            self.vehicle_manager.spawn_vehicle()
+        self.vehicle_manager.update_vehicles(self.controller.signal_green, self._speed_mult, now)
 
     # animation
     def start_animation(self):
         if not self.is_running: return
-        self.vehicle_manager.update_vehicles(self.controller.signals, self.speed_var.get())
-        self.update_queue_visualization()  # Update queue visualization
-        self.animation_id = self.root.after(ANIM_INTERVAL, self.start_animation)
+        t0 = time.perf_counter()
+        # Nothing to draw while minimized: pause and poll slowly until shown again
+        if not self.root.winfo_viewable():
+            self._last_tick = t0
+            self.animation_id = self._after(HIDDEN_POLL_INTERVAL, self.start_animation)
+            return
+        # Advance the simulation in fixed steps for the wall time since the last
+        # frame, however late Tk ran this one, then draw between the last two steps
+        frame_dt = t0 - self._last_tick
+        self._sim_accum += min(frame_dt, MAX_CATCHUP)
+        self._last_tick = t0
+        # Falling behind: leave the queue strips alone for a couple of frames,
+        # re-arming only once the previous skip has run out
+        if frame_dt > 2 * ANIM_INTERVAL / 1000 and not self._skip_queue_frames:
+            self._skip_queue_frames = 2
+        elif self._skip_queue_frames:
+            self._skip_queue_frames -= 1
+        while self._sim_accum >= SIM_DT:
+            self._sim_accum -= SIM_DT
+            self.step_simulation(t0)
+        self.vehicle_manager.render(self._sim_accum / SIM_DT)
+        # Every item change above is only queued; redraw the canvas once for the whole frame
+        self.canvas.update_idletasks()
+        # Subtract the time this frame took so heavy scenes back off instead of queueing
+        elapsed_ms = (time.perf_counter() - t0) * 1000
+        interval = max(MIN_FRAME_DELAY, int(1000 / self.max_fps - elapsed_ms))
+        self.animation_id = self._after(interval, self.start_animation)
 
     # emergency spawn
     def spawn_emergency_vehicle(self, direction: str, vehicle_type: str):
-        ok = self.vehicle_manager.spawn_vehicle(direction, vehicle_type)
-        if ok:
-            self.controller.add_emergency(direction, vehicle_type)
+        v = self.vehicle_manager.spawn_vehicle(direction, vehicle_type)
+        if v:
+            self.controller.add_emergency(direction, vehicle_type, v.id)
             self.log_event(f"Spawned {vehicle_type.upper()} from {direction.upper()}")
             if not self.is_running:
                 self.start_simulation()
+        elif not self.vehicle_manager.free_slots:
+            self.log_event(f"Could not spawn {vehicle_type} at {direction} (vehicle limit of {MAX_VEHICLES} reached)")
         else:
             self.log_event(f"Could not spawn {vehicle_type} at {direction} (too close)")
 